@@ -23,22 +23,50 @@ import asyncio
 import logging
 import os
 import sys
-import typing
-from typing import Tuple, Union
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 from juju import errors
 from juju.model import Model
+from juju.unit import Unit
 
 from juju_verify import logger as juju_verify_logger
 from juju_verify import stream_handler
 from juju_verify.exceptions import CharmException, JujuVerifyError, VerificationError
-from juju_verify.utils.unit import find_units, find_units_on_machine
+from juju_verify.utils.unit import (
+    find_units,
+    find_units_on_machine,
+    set_action_concurrency,
+)
 from juju_verify.verifiers import SUPPORTED_CHARMS, BaseVerifier, get_verifiers
 from juju_verify.verifiers.result import set_stop_on_failure
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment, unused-ignore]
+
 # set MAX_FRAME_SIZE to 64MB to connect python-libjuju to the model
 JUJU_MAX_FRAME_SIZE = 2**26
+# environment variable to change maximum number of actions running at the same time
+CONCURRENCY_ENV = "JUJU_VERIFY_CONCURRENCY"
 logger = logging.getLogger(__name__)
+# formatters are shared by all config_logger calls
+_FMT_TRACE = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+_FMT_DEBUG = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+_FMT_INFO = logging.Formatter("%(message)s")
+# log level -> (formatter, root logger level, juju-verify logger level)
+_LOG_LEVELS = {
+    # 'trace' level enables debugging in juju lib and other dependencies
+    "trace": (_FMT_TRACE, logging.DEBUG, logging.DEBUG),
+    # 'debug' and 'info' levels affect only the juju-verify logger
+    "debug": (_FMT_DEBUG, logging.INFO, logging.DEBUG),
+    "info": (_FMT_INFO, logging.WARNING, logging.INFO),
+}
+_DESCRIPTION = (
+    "Verify that it's safe to perform selected action on specified units."
+    f"{os.linesep}Currently supported charms are:"
+) + "".join(f"\n\t* {verifier}" for verifier in SUPPORTED_CHARMS)
 
 
 async def connect_model(model_name: Union[str, None]) -> Model:
@@ -65,19 +93,17 @@ async def connect_model(model_name: Union[str, None]) -> Model:
     return model
 
 
-class ExtendAction(argparse.Action):  # pylint: disable=too-few-public-methods
-    """Extend action for argparse.
+async def find_target_units(args: argparse.Namespace) -> List[Unit]:
+    """Connect to the model and find units targeted by the cli arguments."""
+    model = await connect_model(args.model)
 
-    NOTE (rgildein): This action should be removed after python 3.6 support ends, because
-                     since Python 3.8 the "extend" is available directly in stdlib.
-    """
+    if args.units:
+        return await find_units(model, args.units)
 
-    @typing.no_type_check
-    def __call__(self, parser, namespace, values, option_string=None):
-        """Extend existing items with values."""
-        items = getattr(namespace, self.dest) or []
-        items = [*items, *values]  # extend list of items
-        setattr(namespace, self.dest, items)
+    if args.machines:
+        return await find_units_on_machine(model, args.machines)
+
+    raise JujuVerifyError("juju-verify must target either juju units or juju machines")
 
 
 def parse_charm_mapping(charm_map: str = "") -> Tuple[str, str]:
@@ -91,27 +117,24 @@ def parse_charm_mapping(charm_map: str = "") -> Tuple[str, str]:
     if not isinstance(charm_map, str):
         raise ValueError("--map-charm arguments expects string type value.")
 
-    try:
-        app_name, charm_name = charm_map.split(":")
-    except ValueError as exc:
+    app_name, separator, charm_name = charm_map.partition(":")
+    if not separator or ":" in charm_name:
         raise ValueError(
             "Unexpected format of --map-charm argument. For more info see --help."
-        ) from exc
+        )
 
     return app_name, charm_name
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse cli arguments."""
-    description = (
-        "Verify that it's safe to perform selected action on specified units."
-        f"{os.linesep}Currently supported charms are:"
-    )
-    description += "".join(f"\n\t* {verifier}" for verifier in SUPPORTED_CHARMS)
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the cli argument parser.
+
+    The parser is built only once per process and then reused.
+    """
     parser = argparse.ArgumentParser(
-        description=description, formatter_class=argparse.RawDescriptionHelpFormatter
+        description=_DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.register("action", "extend", ExtendAction)
 
     parser.add_argument(
         "--model", "-m", required=False, help="Connect to specific model."
@@ -161,35 +184,50 @@ def parse_args() -> argparse.Namespace:
         type=str,
         help="Check all units on the machine.",
     )
-    return parser.parse_args()
+    return parser
+
+
+@lru_cache(maxsize=1)
+def parse_args() -> argparse.Namespace:
+    """Parse cli arguments.
+
+    The arguments are parsed only once per process, any subsequent call returns the
+    same Namespace.
+    """
+    return _get_parser().parse_args()
 
 
 def config_logger(log_level: str) -> None:
     """Configure logging options."""
     log_level = log_level.lower()
-    root_logger = logging.getLogger()
+    try:
+        formatter, root_level, local_level = _LOG_LEVELS[log_level]
+    except KeyError as exc:
+        raise JujuVerifyError(
+            f"Unsupported log level requested: '{log_level}'"
+        ) from exc
+
+    stream_handler.setFormatter(formatter)
+    logging.getLogger().setLevel(root_level)
+    juju_verify_logger.setLevel(local_level)
 
-    if log_level == "trace":
-        # 'trace' level enables debugging in juju lib and other dependencies
-        stream_handler.setFormatter(
-            logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-        )
-        root_logger.setLevel(logging.DEBUG)
-        juju_verify_logger.setLevel(logging.DEBUG)
-    elif log_level == "debug":
-        stream_handler.setFormatter(
-            logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
-        )
-        root_logger.setLevel(logging.INFO)
-        # set DEBUG level only for juju-verify logger
-        juju_verify_logger.setLevel(logging.DEBUG)
-    elif log_level == "info":
-        stream_handler.setFormatter(logging.Formatter("%(message)s"))
-        root_logger.setLevel(logging.WARNING)
-        # set INFO level only for juju-verify logger
-        juju_verify_logger.setLevel(logging.INFO)
-    else:
-        raise JujuVerifyError(f"Unsupported log level requested: '{log_level}'")
+
+def config_action_concurrency() -> None:
+    """Configure maximum number of actions running at the same time."""
+    concurrency = os.environ.get(CONCURRENCY_ENV)
+    if concurrency is None:
+        return
+
+    error_msg = f"{CONCURRENCY_ENV} must be a positive integer, not '{concurrency}'"
+    try:
+        value = int(concurrency)
+    except ValueError as exc:
+        raise JujuVerifyError(error_msg) from exc
+
+    if value < 1:
+        raise JujuVerifyError(error_msg)
+
+    set_action_concurrency(value)
 
 
 def entrypoint() -> None:
@@ -198,17 +236,13 @@ def entrypoint() -> None:
         args = parse_args()
         set_stop_on_failure(args.stop_on_failure)
         config_logger(args.log_level)  # update logging option
-        loop = asyncio.get_event_loop()
-        model = loop.run_until_complete(connect_model(args.model))
-
-        if args.units:
-            units = loop.run_until_complete(find_units(model, args.units))
-        elif args.machines:
-            units = loop.run_until_complete(find_units_on_machine(model, args.machines))
-        else:
-            raise JujuVerifyError(
-                "juju-verify must target either juju units or juju machines"
-            )
+        config_action_concurrency()
+        # NOTE: asyncio.run can not be used, because it closes the loop while
+        # the model connection is bound to it and verifiers still run actions on it
+        # the libuv based loop is used if the optional uvloop package is installed
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        units = loop.run_until_complete(find_target_units(args))
 
         for verifier in get_verifiers(units, args.map_charm):
             result = verifier.verify(args.check)
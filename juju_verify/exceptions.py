@@ -47,8 +47,8 @@ class JujuActionFailed(Exception):
     ):
         """Initialize JujuActionFailed error message."""
         params = params or {}
-        params_str = " ".join(f"{name}={value}" for name, value in params.items())
-        juju_error_message = os.linesep.join(f"  {err}" for err in error.errors)
+        params_str = " ".join([f"{name}={value}" for name, value in params.items()])
+        juju_error_message = os.linesep.join([f"  {err}" for err in error.errors])
         self.message = (
             f"{unit.entity_id}: action `{action} {params_str}` failed "
             f"with errors:{os.linesep}{juju_error_message}"
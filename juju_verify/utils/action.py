@@ -15,10 +15,15 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see https://www.gnu.org/licenses/.
 """Helper function to manage Juju action."""
+from typing import Dict
+
 from juju.action import Action
 
 from juju_verify.utils.cache import Cache, CacheManager
 
+# shared fallback for actions without results, it must never be modified
+_EMPTY_RESULTS: Dict[str, str] = {}
+
 
 def data_from_action(action: Action, key: str, default: str = "") -> str:
     """Extract value from Action.data['results'] dictionary.
@@ -28,7 +33,7 @@ def data_from_action(action: Action, key: str, default: str = "") -> str:
     :param default: default value to return if the 'key' is not found
     :return: value from the action's results identified by 'key' or default
     """
-    return action.data.get("results", {}).get(key, default)
+    return action.data.get("results", _EMPTY_RESULTS).get(key, default)
 
 
 cache_manager = CacheManager(enabled=True)
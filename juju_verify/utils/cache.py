@@ -15,9 +15,9 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see https://www.gnu.org/licenses/.
 """Helper function to manage cache."""
-from collections import OrderedDict
 from contextlib import _GeneratorContextManager, contextmanager
-from typing import Any, Generator, List
+from itertools import islice
+from typing import Any, Dict, Generator, KeysView
 
 
 class Cache:
@@ -35,28 +35,41 @@ class Cache:
     run_action('test')  # action 'test' is executed
     run_action('test')  # action 'test' is not executed
     run_action('test')  # action 'test' is not executed
+
+    The oldest keys are evicted lazily, the cache can grow up to twice the 'maxsize'
+    before it is trimmed back to the 'maxsize' most recently used keys.
     """
 
     def __init__(self, maxsize: int):
         """Initialize cache object."""
-        self._cache: OrderedDict = OrderedDict()
+        self._cache: Dict[int, Any] = {}
         self.maxsize: int = maxsize
 
     def __getitem__(self, key: int) -> Any:
         """Get cached value."""
-        if key in self._cache:
-            self._cache.move_to_end(key)  # reorder cache
+        if next(reversed(self._cache), None) == key:
+            return self._cache[key]  # already the most recently used
 
-        return self._cache[key]
+        value = self._cache.pop(key)
+        self._cache[key] = value  # reorder cache
+        return value
 
     def __setitem__(self, key: int, value: Any) -> None:
         """Cache the value using the key."""
         self._cache[key] = value
 
-        # remove the oldest key
-        if len(self._cache) > self.maxsize:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+        # remove the oldest keys
+        if len(self._cache) > 2 * self.maxsize:
+            oldest = len(self._cache) - self.maxsize
+            self._cache = dict(islice(self._cache.items(), oldest, None))
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the key is cached."""
+        return key in self._cache
+
+    def __len__(self) -> int:
+        """Return number of cached values."""
+        return len(self._cache)
 
     def __iter__(self) -> Generator:
         """Iterate over cache keys."""
@@ -68,9 +81,9 @@ class Cache:
         self._cache.clear()
 
     @property
-    def keys(self) -> List[Any]:
-        """Return cached keys."""
-        return list(self._cache.keys())
+    def keys(self) -> KeysView[int]:
+        """Return view of cached keys."""
+        return self._cache.keys()
 
 
 class CacheManager:
@@ -18,7 +18,7 @@
 import asyncio
 import logging
 import os
-import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set
 
 from juju.action import Action
@@ -31,39 +31,49 @@ from juju_verify.exceptions import CharmException, JujuActionFailed, Verificatio
 from juju_verify.utils.action import cache, cache_manager
 
 logger = logging.getLogger(__name__)
-CHARM_URL_PATTERN = re.compile(r"^(.*):(.*/)?(?P<charm>.*)(-\d+)$")
+DEFAULT_CONCURRENCY = 32
+ACTION_CONCURRENCY: int = DEFAULT_CONCURRENCY
 
 
 def get_cache_key(unit: Unit, action: str, **params: Any) -> int:
     """Create hash key from unit, action and params."""
-    return hash(
-        hash(unit.entity_id) + hash(action) + hash(tuple(sorted(params.items())))
-    )
-
+    params_key = tuple(sorted(params.items())) if params else ()
+    return hash((unit.entity_id, action, params_key))
 
-def run_command_on_unit(unit: Unit, command: str, use_cache: bool = True) -> Action:
-    """Run command on unit.
 
-    Execute is same as `juju run --unit <unit> -- <command>`
-    """
+async def _run_command(unit: Unit, command: str, use_cache: bool = True) -> Action:
+    """Run command on unit and wait for results."""
     with cache_manager(use_cache):
+        use_cached = cache_manager.active  # a bypassed cache skips the membership test
         key = get_cache_key(unit, command)
-        if key not in cache or not cache_manager.active:
+        if not use_cached or key not in cache:
             try:
                 logger.debug("run command `%s` on unit %s", command, unit.entity_id)
-                loop = asyncio.get_event_loop()
-                result = loop.run_until_complete(unit.run(command, timeout=2 * 60))
+                result = await unit.run(command, timeout=2 * 60)
                 cache[key] = result  # save result to cache
             except JujuError as error:
-                juju_error_message = os.linesep.join(f"  {err}" for err in error.errors)
+                juju_error_message = os.linesep.join(
+                    [f"  {err}" for err in error.errors]
+                )
                 raise CharmException(
                     f"{unit.entity_id}: command `{command}` failed with errors:"
                     f"{os.linesep}{juju_error_message}"
                 ) from error
 
+            return result
+
         return cache[key]
 
 
+def run_command_on_unit(unit: Unit, command: str, use_cache: bool = True) -> Action:
+    """Run command on unit.
+
+    Execute is same as `juju run --unit <unit> -- <command>`
+    """
+    loop = asyncio.get_event_loop()
+    return loop.run_until_complete(_run_command(unit, command, use_cache))
+
+
 async def _run_action(
     unit: Unit,
     action: str,
@@ -74,7 +84,8 @@ async def _run_action(
     params = params or {}
     key = get_cache_key(unit, action, **params)
     with cache_manager(use_cache):
-        if key not in cache or not cache_manager.active:
+        use_cached = cache_manager.active  # a bypassed cache skips the membership test
+        if not use_cached or key not in cache:
             try:
                 logger.debug("run action %s on unit %s", action, unit.entity_id)
                 _action = await unit.run_action(action, **params)
@@ -83,9 +94,43 @@ async def _run_action(
             except JujuError as error:
                 raise JujuActionFailed(error, unit, action, params) from error
 
+            return result
+
         return cache[key]
 
 
+def action_concurrency() -> int:
+    """Get maximum number of actions running at the same time."""
+    return ACTION_CONCURRENCY
+
+
+def set_action_concurrency(concurrency: int = DEFAULT_CONCURRENCY) -> None:
+    """Set maximum number of actions running at the same time."""
+    global ACTION_CONCURRENCY  # pylint: disable=W0603
+    ACTION_CONCURRENCY = concurrency
+
+
+async def _run_actions(
+    units: List[Unit],
+    action: str,
+    params: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+) -> List[Any]:
+    """Run Juju action on units, with a limited number of actions running at once.
+
+    Failures are returned in place of results, so all actions are finished.
+    """
+    semaphore = asyncio.Semaphore(action_concurrency())
+
+    async def run_limited_action(unit: Unit) -> Action:
+        async with semaphore:
+            return await _run_action(unit, action, params, use_cache)
+
+    return await asyncio.gather(
+        *(run_limited_action(unit) for unit in units), return_exceptions=True
+    )
+
+
 def run_action_on_units(
     units: List[Unit],
     action: str,
@@ -102,14 +147,17 @@ def run_action_on_units(
              provided in 'units' and actions are their matching,
              juju.Action objects that have been executed and awaited.
     """
+    # the same unit may be listed more than once, but the action runs on it only once
+    units = list({unit.entity_id: unit for unit in units}.values())
     loop = asyncio.get_event_loop()
-    task_map = {
-        unit.entity_id: loop.create_task(_run_action(unit, action, params, use_cache))
-        for unit in units
-    }
-    tasks: asyncio.Future = asyncio.gather(*task_map.values())
-    results: List[Action] = loop.run_until_complete(tasks)
-    result_map = dict(zip(task_map.keys(), results))
+    results = loop.run_until_complete(_run_actions(units, action, params, use_cache))
+    # all actions are finished, so the first failure can be raised without
+    # leaving other actions running in the background
+    for action_result in results:
+        if isinstance(action_result, BaseException):
+            raise action_result
+
+    result_map = {unit.entity_id: result for unit, result in zip(units, results)}
 
     failed_actions_msg = []
     for unit_id, action_result in result_map.items():
@@ -150,15 +198,19 @@ def run_action_on_unit(
     return results[unit.entity_id]
 
 
+@lru_cache(maxsize=1024)
 def parse_charm_name(charm_url: str) -> str:
     """Parse charm name from full charm url.
 
     Example: 'cs:focal/nova-compute-141' -> 'nova-compute'
+    The parsed names are cached, since the same charm urls are parsed many times.
     """
-    match = CHARM_URL_PATTERN.match(charm_url)
-    if match is None:
+    _, schema_separator, charm_path = charm_url.rpartition(":")
+    charm, revision_separator, revision = charm_path.rpartition("/")[2].rpartition("-")
+    if not schema_separator or not revision_separator or not revision.isdigit():
         raise CharmException(f"Failed to parse charm-url: '{charm_url}'")
-    return match.group("charm")
+
+    return charm
 
 
 def verify_charm_unit(charm_name: str, *units: Unit) -> None:
@@ -183,13 +235,12 @@ def get_first_active_unit(units: List[Unit]) -> Optional[Unit]:
 
 def get_applications_names(model: Model, application: str) -> List[str]:
     """Get all names of application based on the same charm."""
-    applications = []
-    for app_name, app in model.applications.items():
-        unit = get_first_active_unit(app.units)
-        if unit and parse_charm_name(unit.charm_url) == application:
-            applications.append(app_name)
-
-    return applications
+    return [
+        app_name
+        for app_name, app in model.applications.items()
+        if (unit := get_first_active_unit(app.units))
+        and parse_charm_name(unit.charm_url) == application
+    ]
 
 
 def get_related_charm_units_to_app(application: Application, charm: str) -> Set[Unit]:
@@ -198,20 +249,22 @@ def get_related_charm_units_to_app(application: Application, charm: str) -> Set[
     :param application: Juju application
     :param charm: charm name, e.g. ceph-osd
     """
-    units: Set[Unit] = set()
-    for relation in application.relations:
-        if parse_charm_name(relation.provides.application.charm_url) == charm:
-            units = units.union(relation.provides.application.units)
-
-    return units
+    return {
+        unit
+        for relation in application.relations
+        if parse_charm_name(relation.provides.application.charm_url) == charm
+        for unit in relation.provides.application.units
+    }
 
 
 def find_unit_by_hostname(model: Model, hostname: str, charm: str) -> Unit:
     """Find unit by hostname."""
     for unit in model.units.values():
+        # NOTE: the charm is compared first, because Unit.machine rebuilds the whole
+        # map of model machines on every access
         if (
-            unit.machine.hostname == hostname
-            and parse_charm_name(unit.charm_url) == charm
+            parse_charm_name(unit.charm_url) == charm
+            and unit.machine.hostname == hostname
         ):
             return unit
 
@@ -228,16 +281,12 @@ async def find_units(model: Model, units: List[str]) -> List[Unit]:
     :param units: List of unit names to search
     :return: List of matching juju.Unit objects
     """
-    selected_units: List[Unit] = []
-
-    for unit_name in units:
-        unit = model.units.get(unit_name)
-        if unit is None:
-            raise CharmException(f"Unit '{unit_name}' not found in the model.")
-
-        selected_units.append(unit)
-
-    return selected_units
+    # NOTE: Model.units builds a new dictionary on every access
+    model_units = model.units
+    try:
+        return [model_units[unit_name] for unit_name in units]
+    except KeyError as exc:
+        raise CharmException(f"Unit '{exc.args[0]}' not found in the model.") from exc
 
 
 async def find_units_on_machine(model: Model, machines: List[str]) -> List[Unit]:
@@ -247,8 +296,9 @@ async def find_units_on_machine(model: Model, machines: List[str]) -> List[Unit]
     :param machines: names of Juju machines on which to search units
     :return: List of juju.Unit objects that match units running on the machines
     """
+    machines_set = frozenset(machines)
     return [
         unit
-        for _, unit in model.units.items()
-        if unit.machine.entity_id in machines and not unit.data.get("subordinate")
+        for unit in model.units.values()
+        if unit.machine.entity_id in machines_set and not unit.data.get("subordinate")
     ]
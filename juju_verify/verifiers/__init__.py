@@ -18,8 +18,7 @@
 """Package with classes implementing verification methods for various charms."""
 import logging
 import os
-from collections import defaultdict
-from typing import Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from juju.unit import Unit
 
@@ -42,6 +41,7 @@ SUPPORTED_CHARMS = {
     "neutron-gateway": NeutronGateway,
     "ovn-central": OvnCentral,
 }
+_SUPPORTED_CHARMS_STR = os.linesep.join(SUPPORTED_CHARMS.keys())
 
 
 def get_verifiers(
@@ -59,14 +59,14 @@ def get_verifiers(
         raise CharmException("List of units can not be empty when creating verifier")
 
     charm_map = charm_map or []
-    charms = defaultdict(list)
+    charms: Dict[str, List[Unit]] = {}
     mapped_applications = dict(charm_map)
 
     for unit in units:
-        unit_application = unit.data.get("application")
-        if unit_application in mapped_applications:
-            # Assign charm type based on explicit mapping
-            charm_type = mapped_applications[unit_application]
+        unit_data = unit.data  # Unit.data is looked up in the model state
+        # Assign charm type based on explicit mapping
+        charm_type = mapped_applications.get(unit_data.get("application"))
+        if charm_type is not None:
             logger.debug(
                 "Using explicitly defined charm for unit %s: %s",
                 unit.entity_id,
@@ -74,23 +74,29 @@ def get_verifiers(
             )
         else:
             # Infer charm type based on charm URL
-            charm_type = parse_charm_name(unit.data.get("charm-url", ""))
+            charm_type = parse_charm_name(unit_data.get("charm-url", ""))
             logger.debug("Inferred charm for unit %s: %s", unit.entity_id, charm_type)
-        charms[charm_type].append(unit)
+        charms.setdefault(charm_type, []).append(unit)
 
     for charm, charm_units in charms.items():
-        logger.info("===[%s]===", ", ".join([unit.entity_id for unit in charm_units]))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "===[%s]===", ", ".join([unit.entity_id for unit in charm_units])
+            )
+
         verifier = SUPPORTED_CHARMS.get(charm)
         if verifier is None:
-            supported_charms = os.linesep.join(SUPPORTED_CHARMS.keys())
             logger.error(
                 "Charm '%s' is not supported by juju-verify. Supported charms:%s%s",
                 charm,
                 os.linesep,
-                supported_charms,
+                _SUPPORTED_CHARMS_STR,
             )
             continue
 
-        exclude_affected_units = list(set(units).difference(charm_units))
+        charm_unit_ids = {unit.entity_id for unit in charm_units}
+        exclude_affected_units = [
+            unit for unit in units if unit.entity_id not in charm_unit_ids
+        ]
         logger.debug("Initiating verifier instance of class: %s", verifier.__name__)
         yield verifier(units=charm_units, exclude_affected_units=exclude_affected_units)
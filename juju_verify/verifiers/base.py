@@ -17,9 +17,19 @@
 """Base for other modules that implement verification checks for specific charms."""
 import asyncio
 import logging
-from collections import defaultdict, namedtuple
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from juju.action import Action
 from juju.model import Model
@@ -33,7 +43,31 @@ from juju_verify.verifiers.result import Result, Severity, checks_executor
 logger = logging.getLogger(__name__)
 
 
-class BaseVerifier:
+def _parent_machine_ids(machine_id: str) -> Iterator[str]:
+    """Yield IDs of all machines hosting the machine, e.g. '0/lxd' and '0' for '0/lxd/1'.
+
+    The IDs are prefixes of the machine ID, so 'virtual' IDs like '0/lxd' are also
+    produced.
+    """
+    index = machine_id.rfind("/")
+    while index > 0:
+        machine_id = machine_id[:index]
+        yield machine_id
+        index = machine_id.rfind("/")
+
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Version:
+    """Parse juju agent version, usually shared by all units in the model."""
+    return Version(version)
+
+
+async def _get_leader_statuses(units: Iterable[Unit]) -> List[bool]:
+    """Query leadership of all units concurrently."""
+    return await asyncio.gather(*(unit.is_leader_from_status() for unit in units))
+
+
+class BaseVerifier:  # pylint: disable=R0902
     """Base class for implementation of verification checks for specific charms.
 
     Classes that inherit from this base must override class variable 'NAME' to
@@ -45,6 +79,11 @@ class BaseVerifier:
     """
 
     NAME = ""
+    # verification check name -> name of the method that implements it
+    CHECKS: ClassVar[Dict[str, str]] = {
+        "shutdown": "verify_shutdown",
+        "reboot": "verify_reboot",
+    }
 
     def __init__(
         self, units: List[Unit], exclude_affected_units: Optional[List[Unit]] = None
@@ -66,6 +105,10 @@ class BaseVerifier:
         self.units = units
         self.affected_machines = set()
         self.exclude_affected_units = exclude_affected_units or []
+        # verifier units grouped by machine, Unit.machine is resolved only once
+        self._machine_units: Dict[str, List[Unit]] = {}
+        unit_ids: List[str] = []
+        self._unit_by_id: Dict[str, Unit] = {}
         models = set()
 
         if not self.units:
@@ -74,8 +117,14 @@ class BaseVerifier:
                 " is not associated with any units."
             )
         for unit in self.units:
-            self.affected_machines.add(unit.machine.entity_id)
+            machine_id = unit.machine.entity_id
+            self.affected_machines.add(machine_id)
+            self._machine_units.setdefault(machine_id, []).append(unit)
             models.add(unit.model)
+            unit_ids.append(unit.entity_id)
+            self._unit_by_id[unit.entity_id] = unit
+
+        self._unit_ids: Tuple[str, ...] = tuple(unit_ids)
 
         # Unit.model is mandatory property, so we end up either with one model
         # (correct) or multiple models (incorrect) in the 'models' set.
@@ -84,45 +133,35 @@ class BaseVerifier:
                 "Verifier initiated with units from multiple models."
             )
         self.model: Model = models.pop()
-        self._unit_ids: List[str] = []
+        # units checked by this verifier or explicitly checked by other verifiers
+        self._verified_units = frozenset(self._unit_ids).union(
+            unit.entity_id for unit in self.exclude_affected_units
+        )
 
     @property
-    def unit_ids(self) -> List[str]:
+    def unit_ids(self) -> Tuple[str, ...]:
         """Return entity IDs of self.units."""
-        return self._unit_ids or [unit.entity_id for unit in self.units]
-
-    @classmethod
-    def supported_checks(cls) -> List[str]:
-        """Return list of supported checks."""
-        return list(cls._action_map().keys())
+        return self._unit_ids
 
     @classmethod
-    def _action_map(cls) -> Dict[str, Callable[["BaseVerifier"], Result]]:
-        """Return verification checks mapper.
+    @lru_cache(maxsize=None)
+    def supported_checks(cls) -> Tuple[str, ...]:
+        """Return supported checks.
 
-        The key is the verification name. The value is a callable method that
-        implements the logic.
+        The result is cached for each class, since the checks are fixed at the class
+        definition.
         """
-        return {
-            "shutdown": cls.verify_shutdown,
-            "reboot": cls.verify_reboot,
-        }
+        return tuple(cls.CHECKS)
 
     def get_verify_action(self, check: str) -> Callable:
         """Return verification check as callable function without any arguments."""
-        if check not in self.supported_checks():
+        method = self.CHECKS.get(check)
+        if method is None:
             raise NotImplementedError(
                 f"Unsupported verification check '{check}' for charm {self.NAME}"
             )
 
-        _verify_action = self._action_map()[check]
-
-        @wraps(_verify_action)
-        def wrapper() -> Result:
-            """Wrap the classmethod so that it is callable without any arguments."""
-            return _verify_action(self)
-
-        return wrapper
+        return getattr(self, method)
 
     def unit_from_id(self, unit_id: str) -> Unit:
         """Search self.units for unit that matches 'unit_id'.
@@ -130,12 +169,12 @@ class BaseVerifier:
         :param unit_id: ID of the unit to find
         :return: Unit that matches 'unit_id'
         """
-        for unit in self.units:
-            if unit.entity_id == unit_id:
-                return unit
-        raise VerificationError(
-            f"Unit {unit_id} was not found in {self.NAME} verifier."
-        )
+        try:
+            return self._unit_by_id[unit_id]
+        except KeyError as error:
+            raise VerificationError(
+                f"Unit {unit_id} was not found in {self.NAME} verifier."
+            ) from error
 
     @staticmethod
     def check_minimum_version(min_version: Version, units: List[Unit]) -> Result:
@@ -144,7 +183,7 @@ class BaseVerifier:
         for unit in units:
             juju_version = unit.safe_data.get("agent-status", {}).get("version", "")
             try:
-                if Version(juju_version) < min_version:
+                if _parse_version(juju_version) < min_version:
                     fail_msg = (
                         f"Juju agent on unit {unit.entity_id} has lower than "
                         f"minimum required version. {juju_version} < "
@@ -158,6 +197,19 @@ class BaseVerifier:
 
         return result or Result(Severity.OK, "Minimum juju version check passed.")
 
+    @cached_property
+    def _machine_unit_index(self) -> Dict[str, List[Unit]]:
+        """Map IDs of machines in the model to all units running on them.
+
+        The index is built once, since Unit.machine rebuilds the whole map of model
+        machines on every access.
+        """
+        index: Dict[str, List[Unit]] = {}
+        for unit in self.model.units.values():
+            index.setdefault(unit.machine.entity_id, []).append(unit)
+
+        return index
+
     def check_affected_machines(self) -> Result:
         """Check if affected machines run other principal units.
 
@@ -165,26 +217,37 @@ class BaseVerifier:
         runs other principal units that are not being checked.
         """
         result = Result()
-        machine_map: Dict = defaultdict(list)
-        for unit in self.model.units.values():
-            if unit.machine.entity_id in self.affected_machines and not unit.data.get(
-                "subordinate"
-            ):
-                machine_map[unit.machine.entity_id].append(unit.entity_id)
-
-        verified_units = self.unit_ids.copy()
-        verified_units.extend(unit.entity_id for unit in self.exclude_affected_units)
-
-        for machine, unit_list in machine_map.items():
-            for unit in unit_list:
-                if unit not in verified_units:
-                    result.add_partial_result(
-                        Severity.WARN,
-                        f"Machine {machine} runs other principal "
-                        f"unit that is not being checked: {unit}",
-                    )
+        affected_machines = self.affected_machines
+        verified_units = self._verified_units
+        for machine_id, units in self._machine_unit_index.items():
+            if machine_id not in affected_machines:
+                continue
+
+            for unit in units:
+                if unit.entity_id in verified_units or unit.data.get("subordinate"):
+                    continue
+
+                result.add_partial_result(
+                    Severity.WARN,
+                    f"Machine {machine_id} runs other principal "
+                    f"unit that is not being checked: {unit.entity_id}",
+                )
         return result
 
+    def _child_units_by_parent(self) -> Dict[str, List[Unit]]:
+        """Map IDs of verified units to units running on their child machines.
+
+        Any unit whose machine is hosted by the machine of a verified unit is a child
+        of that unit.
+        """
+        children: Dict[str, List[Unit]] = defaultdict(list)
+        for machine_id, units in self._machine_unit_index.items():
+            for machine in _parent_machine_ids(machine_id):
+                for parent_unit in self._machine_units.get(machine, []):
+                    children[parent_unit.entity_id].extend(units)
+
+        return children
+
     def check_has_sub_machines(self) -> Result:
         """Check if the machine hosts containers or VMs.
 
@@ -192,43 +255,29 @@ class BaseVerifier:
         affected machines.
         """
         result = Result()
-        ParentChildPair = namedtuple("ParentChildPair", "child parent")
-        parent_child_pairs = {}
-        parents = set()
-
-        # Search for child machines
-        for parent_unit in self.units:
-            # search the list of units for any that have the unit's machine as a parent
-            for _, potential_child in self.model.units.items():
-                if potential_child.machine.entity_id.startswith(
-                    parent_unit.machine.entity_id + "/"
-                ):
-                    parents.add(parent_unit.entity_id)
-                    parent_child_pairs[potential_child.entity_id] = ParentChildPair(
-                        child=potential_child, parent=parent_unit
-                    )
-
-        task_map = {
-            child_tag: parent_child_pair.child.is_leader_from_status()
-            for child_tag, parent_child_pair in parent_child_pairs.items()
+        parent_to_children = self._child_units_by_parent()
+        child_units = {
+            child.entity_id: child
+            for children in parent_to_children.values()
+            for child in children
         }
+        if not child_units:
+            return result  # no child machines, there is nothing to query
 
         loop = asyncio.get_event_loop()
-
-        results = loop.run_until_complete(asyncio.gather(*task_map.values()))
-        result_map = dict(zip(task_map.keys(), results))
+        results = loop.run_until_complete(_get_leader_statuses(child_units.values()))
+        result_map = dict(zip(child_units.keys(), results))
 
         # loop through list of parents, format a message
-        for check_unit_entity_id in parents:
-            for _, child_parent_pair in parent_child_pairs.items():
-                if child_parent_pair.parent.entity_id == check_unit_entity_id:
-                    child_tag = child_parent_pair.child.entity_id
-                    child_tag += "*" if result_map[child_tag] else ""
-                    result.add_partial_result(
-                        Severity.WARN,
-                        f"{check_unit_entity_id} has units running"
-                        f" on child machines: {child_tag}",
-                    )
+        for check_unit_entity_id, children in parent_to_children.items():
+            for child in children:
+                child_tag = child.entity_id
+                child_tag += "*" if result_map[child_tag] else ""
+                result.add_partial_result(
+                    Severity.WARN,
+                    f"{check_unit_entity_id} has units running"
+                    f" on child machines: {child_tag}",
+                )
         return result
 
     def verify(self, check: str) -> Result:
@@ -244,9 +293,11 @@ class BaseVerifier:
         preflight_checks = (self.check_affected_machines, self.check_has_sub_machines)
 
         try:
-            logger.debug(
-                "Running check %s on units: %s", check, ",".join(self.unit_ids)
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Running check %s on units: %s", check, ",".join(self._unit_ids)
+                )
+
             return checks_executor(*preflight_checks, verify_action)
         except NotImplementedError as exc:
             raise exc
@@ -62,6 +62,14 @@ CRUSH_RULE_DEVICE_TYPES = {
     "default~nvme": "nvme",
 }
 
+CEPH_HEALTH_STATES = {
+    # <health-state>: (<severity>, <message>)
+    "HEALTH_OK": (Severity.OK, "Ceph cluster is healthy"),
+    "HEALTH_WARN": (Severity.FAIL, "Ceph cluster is in a warning state"),
+    "HEALTH_ERR": (Severity.FAIL, "Ceph cluster is unhealthy"),
+}
+CEPH_UNKNOWN_HEALTH_STATE = (Severity.FAIL, "Ceph cluster is in an unknown state")
+
 
 class CrushRuleInfo(NamedTuple):
     """Information about Node obtains from `ceph osd dump`."""
@@ -299,27 +307,18 @@ class CephCommon(BaseVerifier):  # pylint: disable=W0223
             cluster_health = data_from_action(action, "message")
             logger.debug("Unit (%s): Ceph cluster health '%s'", unit, cluster_health)
 
-            if "HEALTH_OK" in cluster_health:
-                result.add_partial_result(
-                    Severity.OK, f"{unit}: Ceph cluster is healthy"
-                )
-            elif "HEALTH_WARN" in cluster_health:
-                result.add_partial_result(
-                    Severity.FAIL,
-                    f"{unit}: Ceph cluster is in a warning state{os.linesep}"
-                    f"  {cluster_health}",
-                )
-            elif "HEALTH_ERR" in cluster_health:
-                result.add_partial_result(
-                    Severity.FAIL,
-                    f"{unit}: Ceph cluster is unhealthy{os.linesep}  {cluster_health}",
-                )
-            else:
-                result.add_partial_result(
-                    Severity.FAIL,
-                    f"{unit}: Ceph cluster is in an unknown state{os.linesep}"
-                    f"  {cluster_health}",
-                )
+            severity, message = next(
+                (
+                    health_result
+                    for health_state, health_result in CEPH_HEALTH_STATES.items()
+                    if health_state in cluster_health
+                ),
+                CEPH_UNKNOWN_HEALTH_STATE,
+            )
+            if severity != Severity.OK:
+                message += f"{os.linesep}  {cluster_health}"
+
+            result.add_partial_result(severity, f"{unit}: {message}")
 
         if not action_map:
             result = Result(Severity.FAIL, "Ceph cluster status could not be obtained")
@@ -140,11 +140,10 @@ class NeutronGateway(BaseVerifier):
                 router_failover_err_list.append(error_string)
 
         if router_failover_err_list:
-            error_string = (
+            reason = (
                 "It's recommended that you manually failover the following "
-                "routers: {}"
+                f"routers: {', '.join(router_failover_err_list)}"
             )
-            reason = error_string.format(", ".join(router_failover_err_list))
             result = Result(Severity.WARN, reason)
 
         return result
@@ -157,11 +156,10 @@ class NeutronGateway(BaseVerifier):
         affected_lbaas_units = set(self.unit_ids) & units_with_lbaas
 
         if affected_lbaas_units:
-            message = (
+            reason = (
                 "Following units have neutron LBaasV2 load-balancers that will be "
-                "lost on unit reboot/shutdown: {}"
+                f"lost on unit reboot/shutdown: {', '.join(affected_lbaas_units)}"
             )
-            reason = message.format(", ".join(affected_lbaas_units))
             result = Result(Severity.WARN, reason)
 
         return result
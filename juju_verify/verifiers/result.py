@@ -92,6 +92,8 @@ class Result:
     check runs against multiple units.
     """
 
+    __slots__ = ("partials",)
+
     VERBOSE_MAP = {
         Severity.OK: "OK (All checks passed)",
         Severity.WARN: "OK (Checks passed with warnings)",
@@ -126,23 +128,19 @@ class Result:
                 "No result or additional information. This may be a bug in "
                 "'juju-verify'."
             )
-        output = f"Checks:{os.linesep}"
-        for partial in self.partials:
-            output += f"{partial}{os.linesep}"
-        output += os.linesep
-
+        checks = "".join([f"{partial}{os.linesep}" for partial in self.partials])
         max_severity = max(partial.severity for partial in self.partials)
-        output += f"Result: {self.VERBOSE_MAP.get(max_severity)}{os.linesep}"
-        return output
+        return (
+            f"Checks:{os.linesep}{checks}{os.linesep}"
+            f"Result: {self.VERBOSE_MAP.get(max_severity)}{os.linesep}"
+        )
 
     def __add__(self, other: object) -> "Result":
         """Perform "add" operation with another Result instance."""
         if not isinstance(other, Result):
             return NotImplemented
         new_obj = Result()
-
-        for partial in self.partials + other.partials:
-            new_obj.partials.append(partial)
+        new_obj.partials = self.partials + other.partials
 
         return new_obj
 
@@ -151,8 +149,7 @@ class Result:
         if not isinstance(other, Result):
             return NotImplemented
 
-        for partial in other.partials:
-            self.partials.append(partial)
+        self.partials.extend(other.partials)
         return self
 
     def __eq__(self, other: object) -> bool:
@@ -21,7 +21,7 @@ import os
 import pkgutil
 from argparse import Namespace
 from asyncio import Future
-from unittest.mock import ANY, MagicMock, call
+from unittest.mock import MagicMock, call
 
 import pytest
 from juju import errors
@@ -32,6 +32,22 @@ from juju_verify.exceptions import CharmException, JujuVerifyError, Verification
 from juju_verify.verifiers.base import Result, Severity
 
 
+@pytest.fixture(autouse=True)
+def no_uvloop(mocker):
+    """Run the cli on the default asyncio loop, even if uvloop is installed."""
+    mocker.patch.object(cli, "uvloop", None)
+
+
+@pytest.fixture()
+def clear_parser_cache():
+    """Clear cached cli parser and parsed arguments before and after the test."""
+    cli._get_parser.cache_clear()
+    cli.parse_args.cache_clear()
+    yield
+    cli._get_parser.cache_clear()
+    cli.parse_args.cache_clear()
+
+
 def test_all_loggers():
     """Test if all logger used in this project inherited from juju_verify.
 
@@ -113,6 +129,39 @@ def test_unsupported_log_levels(log_level):
         assert expected_msg in str(error.value)
 
 
+@pytest.mark.parametrize("env_value, exp_concurrency", [("1", 1), ("100", 100)])
+def test_config_action_concurrency(mocker, monkeypatch, env_value, exp_concurrency):
+    """Test setting the maximum number of actions running at the same time."""
+    monkeypatch.setenv("JUJU_VERIFY_CONCURRENCY", env_value)
+    mock_set_concurrency = mocker.patch.object(cli, "set_action_concurrency")
+
+    cli.config_action_concurrency()
+
+    mock_set_concurrency.assert_called_once_with(exp_concurrency)
+
+
+def test_config_action_concurrency_default(mocker, monkeypatch):
+    """Test that the default concurrency is kept if it is not configured."""
+    monkeypatch.delenv("JUJU_VERIFY_CONCURRENCY", raising=False)
+    mock_set_concurrency = mocker.patch.object(cli, "set_action_concurrency")
+
+    cli.config_action_concurrency()
+
+    mock_set_concurrency.assert_not_called()
+
+
+@pytest.mark.parametrize("env_value", ["0", "-1", "many", "", "²", " 4x"])
+def test_config_action_concurrency_invalid(mocker, monkeypatch, env_value):
+    """Test that invalid maximum number of actions fails."""
+    monkeypatch.setenv("JUJU_VERIFY_CONCURRENCY", env_value)
+    mock_set_concurrency = mocker.patch.object(cli, "set_action_concurrency")
+
+    with pytest.raises(JujuVerifyError, match="must be a positive integer"):
+        cli.config_action_concurrency()
+
+    mock_set_concurrency.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "arg_value, exp_result, exp_failure",
     [
@@ -217,6 +266,7 @@ def test_parse_charm_mapping(arg_value, exp_result, exp_failure):
         ),
     ],
 )
+@pytest.mark.usefixtures("clear_parser_cache")
 def test_parse_args(args, exp_args, mocker):
     """Test for argument parsing."""
     mocker.patch("sys.argv", ["juju-verify", *args])
@@ -246,6 +296,7 @@ def test_parse_args(args, exp_args, mocker):
         ["reboot", "--units", "ceph-osd/0", "--machines", "0"],
     ],
 )
+@pytest.mark.usefixtures("clear_parser_cache")
 def test_parse_args_error(args, mocker):
     """Test for argument parsing raise error."""
     mocker.patch("sys.argv", ["juju-verify", *args])
@@ -254,43 +305,58 @@ def test_parse_args_error(args, mocker):
         cli.parse_args()
 
 
-def test_main_cli_target_units(mocker):
-    """Verify workflow of the main cli when script targets units."""
-    args = MagicMock()
-    args.log_level = "info"
-    args.model = None
-    args.check = "shutdown"
-    args.units = ["nova-compute/0"]
-    args.machines = None
+@pytest.mark.usefixtures("clear_parser_cache")
+def test_parse_args_cached(mocker):
+    """Test that parser is built and arguments are parsed only once."""
+    mocker.patch("sys.argv", ["juju-verify", "reboot", "--units", "ceph-osd/0"])
+    mock_parse_args = mocker.spy(cli.argparse.ArgumentParser, "parse_args")
 
-    result = Result(Severity.OK, "Passed")
-    verifier = MagicMock()
-    verifier.verify.return_value = result
+    result = cli.parse_args()
 
-    mocker.patch.object(cli, "parse_args").return_value = args
-    mocker.patch.object(cli, "get_verifiers").return_value = [verifier]
-    mocker.patch.object(cli, "asyncio")
-    mocker.patch.object(cli, "connect_model", new_callable=MagicMock())
-    mocker.patch.object(cli, "find_units", new_callable=MagicMock())
-    logger = mocker.patch.object(cli, "logger")
+    assert cli.parse_args() is result
+    assert cli._get_parser() is cli._get_parser()
+    mock_parse_args.assert_called_once()
 
-    cli.entrypoint()
 
-    cli.connect_model.assert_called_with(args.model)
-    cli.find_units.assert_called_with(ANY, args.units)
-    verifier.verify.asssert_called_with(args.check)
-    logger.info.assert_called_with("%s", result)
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "units, machines, exp_finder",
+    [
+        (["nova-compute/0"], None, "find_units"),
+        (None, ["0"], "find_units_on_machine"),
+    ],
+)
+async def test_find_target_units(mocker, units, machines, exp_finder):
+    """Test finding units targeted either by unit names or by machines."""
+    args = Namespace(model=None, units=units, machines=machines)
+    expected_units = ["nova-compute/0"]
+    model = mocker.patch.object(cli, "connect_model").return_value
+    mocker.patch.object(cli, "find_units").return_value = expected_units
+    mocker.patch.object(cli, "find_units_on_machine").return_value = expected_units
+
+    result = await cli.find_target_units(args)
+
+    assert result == expected_units
+    cli.connect_model.assert_called_once_with(args.model)
+    getattr(cli, exp_finder).assert_called_once_with(model, units or machines)
 
 
-def test_main_cli_target_machine(mocker):
-    """Verify workflow of the main cli when script targets machines."""
+@pytest.mark.asyncio
+async def test_find_target_units_no_target_fail(mocker):
+    """Test that finding units fails if not target (units/machines) is specified."""
+    args = Namespace(model=None, units=None, machines=None)
+    expected_msg = "juju-verify must target either juju units or juju machines"
+    mocker.patch.object(cli, "connect_model")
+
+    with pytest.raises(JujuVerifyError, match=expected_msg):
+        await cli.find_target_units(args)
+
+
+def test_main_cli(mocker):
+    """Verify workflow of the main cli."""
     args = MagicMock()
     args.log_level = "info"
-    args.model = None
     args.check = "shutdown"
-    args.machines = ["0"]
-    args.units = None
-    expected_units = ["nova-compute/0"]
 
     result = Result(Severity.OK, "Passed")
     verifier = MagicMock()
@@ -298,40 +364,64 @@ def test_main_cli_target_machine(mocker):
 
     mocker.patch.object(cli, "parse_args").return_value = args
     mocker.patch.object(cli, "get_verifiers").return_value = [verifier]
-    mocker.patch.object(cli, "asyncio")
-    mocker.patch.object(cli, "connect_model", new_callable=MagicMock())
-    mocker.patch.object(
-        cli, "find_units_on_machine", new_callable=MagicMock()
-    ).return_value = expected_units
+    mock_asyncio = mocker.patch.object(cli, "asyncio")
+    mocker.patch.object(cli, "find_target_units", new_callable=MagicMock())
     logger = mocker.patch.object(cli, "logger")
 
     cli.entrypoint()
 
-    cli.connect_model.assert_called_with(args.model)
-    cli.find_units_on_machine.assert_called_with(ANY, args.machines)
-    verifier.verify.asssert_called_with(args.check)
+    loop = mock_asyncio.new_event_loop.return_value
+    mock_asyncio.set_event_loop.assert_called_once_with(loop)
+    cli.find_target_units.assert_called_once_with(args)
+    loop.run_until_complete.assert_called_once_with(cli.find_target_units.return_value)
+    verifier.verify.assert_called_once_with(args.check)
     logger.info.assert_called_with("%s", result)
 
 
-def test_main_cli_no_target_fail(mocker):
-    """Test that main fails if not target (units/machines) is specified."""
-    args = MagicMock()
-    args.log_level = "info"
-    args.model = None
-    args.check = "shutdown"
-    args.machines = None
-    args.units = None
+def test_main_cli_uvloop(mocker):
+    """Verify that the main cli runs on uvloop if it is installed."""
+    mocker.patch.object(cli, "parse_args")
+    mocker.patch.object(cli, "config_logger")
+    mocker.patch.object(cli, "get_verifiers").return_value = []
+    mock_asyncio = mocker.patch.object(cli, "asyncio")
+    mock_uvloop = mocker.patch.object(cli, "uvloop")
+    mocker.patch.object(cli, "find_target_units", new_callable=MagicMock())
 
-    expected_msg = "juju-verify must target either juju units or juju machines"
+    cli.entrypoint()
 
-    mocker.patch.object(cli, "parse_args").return_value = args
-    mocker.patch.object(cli, "connect_model", new_callable=MagicMock())
+    mock_uvloop.new_event_loop.assert_called_once_with()
+    mock_asyncio.new_event_loop.assert_not_called()
+    mock_asyncio.set_event_loop.assert_called_once_with(
+        mock_uvloop.new_event_loop.return_value
+    )
+
+
+def test_main_cli_invalid_concurrency_fail(mocker, monkeypatch):
+    """Test that main exits before connecting to the model if config is invalid."""
+    monkeypatch.setenv("JUJU_VERIFY_CONCURRENCY", "0")
+    mocker.patch.object(cli, "parse_args")
+    mocker.patch.object(cli, "config_logger")
     mocker.patch.object(cli, "asyncio")
-    mock_logger = mocker.patch.object(cli, "logger")
+    mocker.patch.object(cli, "find_target_units", new_callable=MagicMock())
+
+    with pytest.raises(SystemExit):
+        cli.entrypoint()
+
+    cli.find_target_units.assert_not_called()
+
+
+def test_main_cli_no_target_fail(mocker):
+    """Test that main exits if finding of the target units fails."""
+    mocker.patch.object(cli, "parse_args")
+    mocker.patch.object(cli, "config_logger")
+    mock_asyncio = mocker.patch.object(cli, "asyncio")
+    mock_asyncio.new_event_loop.return_value.run_until_complete.side_effect = (
+        JujuVerifyError("juju-verify must target either juju units or juju machines")
+    )
+    mocker.patch.object(cli, "find_target_units", new_callable=MagicMock())
 
     with pytest.raises(SystemExit):
         cli.entrypoint()
-        mock_logger.error.assert_callled_once_with(expected_msg)
 
 
 @pytest.mark.parametrize(
@@ -347,8 +437,7 @@ def test_main_expected_failure(mocker, error, error_msg):
     mocker.patch.object(cli, "parse_args")
     mocker.patch.object(cli, "config_logger")
     mocker.patch.object(cli, "asyncio")
-    mocker.patch.object(cli, "connect_model", new_callable=MagicMock())
-    mocker.patch.object(cli, "find_units", new_callable=MagicMock())
+    mocker.patch.object(cli, "find_target_units", new_callable=MagicMock())
     mocker.patch.object(cli, "get_verifiers").side_effect = [error(error_msg)]
     mock_logger = mocker.patch.object(cli, "logger")
 
@@ -29,6 +29,8 @@ def test_cache():
     key_1, action_1 = hash("test-1"), Action("1", MagicMock())
     key_2, action_2 = hash("test-2"), Action("2", MagicMock())
     key_3, action_3 = hash("test-3"), Action("3", MagicMock())
+    key_4, action_4 = hash("test-4"), Action("4", MagicMock())
+    key_5, action_5 = hash("test-5"), Action("5", MagicMock())
 
     cache.maxsize = 2  # change the maximum cache size for testing purposes
     assert cache.maxsize == 2
@@ -37,17 +39,27 @@ def test_cache():
     assert key_1 in cache
     assert key_2 in cache
     assert key_3 not in cache
-    assert cache.keys == [key_1, key_2]  # check keys order
+    assert len(cache) == 2
+    assert list(cache.keys) == [key_1, key_2]  # check keys order
     assert cache[key_1] == action_1
-    assert cache.keys == [key_2, key_1]  # check keys order
+    assert list(cache.keys) == [key_2, key_1]  # check keys order
+    assert cache[key_1] == action_1
+    assert list(cache.keys) == [key_2, key_1]  # most recent key stays last
     cache[key_3] = action_3
+    cache[key_4] = action_4
+    assert len(cache) == 4  # cache can grow up to twice the maxsize
+    assert list(cache.keys) == [key_2, key_1, key_3, key_4]  # check keys order
+    cache[key_5] = action_5
+    assert key_1 not in cache
     assert key_2 not in cache
-    assert key_3 in cache
-    assert cache.keys == [key_1, key_3]  # check keys order
+    assert key_3 not in cache
+    assert list(cache.keys) == [key_4, key_5]  # check keys order
+    assert list(cache) == [key_4, key_5]
     cache.clear()
+    assert len(cache) == 0
     assert key_1 not in cache
     assert key_2 not in cache
-    assert key_3 not in cache
+    assert key_5 not in cache
     # set the maximum cache size back to the default value
     cache.maxsize = default_cache_maxsize
     assert cache.maxsize == default_cache_maxsize
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see https://www.gnu.org/licenses/.
 """Utils unit test suite."""
+import asyncio
 import os
 from typing import Any, Callable, Coroutine, Dict, List
 from unittest import mock
@@ -25,10 +26,12 @@ from juju.errors import JujuError
 from juju.unit import Unit
 from pytest import raises
 
-from juju_verify.exceptions import CharmException, VerificationError
+from juju_verify.exceptions import CharmException, JujuActionFailed, VerificationError
+from juju_verify.utils import unit as unit_utils
 from juju_verify.utils.action import cache_manager
 from juju_verify.utils.unit import (
     _run_action,
+    action_concurrency,
     find_unit_by_hostname,
     find_units,
     find_units_on_machine,
@@ -40,6 +43,7 @@ from juju_verify.utils.unit import (
     run_action_on_unit,
     run_action_on_units,
     run_command_on_unit,
+    set_action_concurrency,
     verify_charm_unit,
 )
 
@@ -59,6 +63,10 @@ def test_get_cache_key():
     ) == get_cache_key(unit_1, "test-action", test=True, format="text")
     assert get_cache_key(unit_1, "test-action") != get_cache_key(unit_2, "test-action")
 
+    # swapping the unit name and the action must not produce the same key
+    unit_1.entity_id, unit_2.entity_id = "test-action", "ceph-osd/0"
+    assert get_cache_key(unit_1, "ceph-osd/0") != get_cache_key(unit_2, "test-action")
+
 
 @pytest.mark.asyncio
 async def test_run_action():
@@ -175,6 +183,84 @@ def test_run_action_on_units(mock_run_action, model):
         assert str(exc.value) == expect_err
 
 
+@mock.patch("juju_verify.utils.unit._run_action")
+def test_run_action_on_units_failure(mock_run_action, model):
+    """Test that the action failure is raised after all actions finish."""
+    run_on_units = [model.units["nova-compute/0"], model.units["nova-compute/1"]]
+    finished_units = []
+
+    async def action_result(unit: Unit, *args, **kwargs):
+        # pylint: disable=unused-argument
+        finished_units.append(unit)
+        if unit.entity_id == "nova-compute/0":
+            raise JujuActionFailed(JujuError("failed"), unit, "unit-action")
+
+        return MagicMock(status="completed")
+
+    mock_run_action.side_effect = action_result
+
+    with raises(JujuActionFailed):
+        run_action_on_units(run_on_units, "unit-action", use_cache=False)
+
+    assert finished_units == run_on_units
+
+
+def test_set_action_concurrency():
+    """Test setting the maximum number of actions running at the same time."""
+    set_action_concurrency(2)
+    assert action_concurrency() == 2
+
+    set_action_concurrency()
+    assert action_concurrency() == 32
+
+
+@mock.patch("juju_verify.utils.unit._run_action")
+def test_run_action_on_units_duplicates(mock_run_action, model):
+    """Test that action runs only once on unit listed multiple times."""
+    unit_1, unit_2 = model.units["nova-compute/0"], model.units["nova-compute/1"]
+
+    async def action_result(unit: Unit, *args, **kwargs):
+        # pylint: disable=unused-argument
+        return MagicMock(status="completed")
+
+    mock_run_action.side_effect = action_result
+
+    results = run_action_on_units([unit_1, unit_2, unit_1], "unit-action")
+
+    assert list(results) == ["nova-compute/0", "nova-compute/1"]
+    mock_run_action.assert_has_calls(
+        [
+            call(unit_1, "unit-action", None, True),
+            call(unit_2, "unit-action", None, True),
+        ]
+    )
+    assert mock_run_action.call_count == 2
+
+
+@mock.patch("juju_verify.utils.unit._run_action")
+def test_run_action_on_units_concurrency(mock_run_action, monkeypatch, model):
+    """Test that the number of actions running at the same time is limited."""
+    monkeypatch.setattr(unit_utils, "ACTION_CONCURRENCY", 2)
+    run_on_units = [model.units[f"nova-compute/{i}"] for i in range(3)]
+    running, max_running = 0, 0
+
+    async def action_result(unit: Unit, *args, **kwargs):
+        # pylint: disable=unused-argument
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return MagicMock(status="completed")
+
+    mock_run_action.side_effect = action_result
+
+    results = run_action_on_units(run_on_units, "unit-action", use_cache=False)
+
+    assert list(results) == [unit.entity_id for unit in run_on_units]
+    assert max_running == 2
+
+
 @mock.patch("juju_verify.utils.unit.run_action_on_units")
 def test_run_action_on_unit(mock_run_action_on_units, model):
     """Test running action on single unit from the verifier."""
@@ -222,6 +308,8 @@ def test_run_command_on_unit():
     [
         ("cs:focal/nova-compute-141", "nova-compute"),
         ("cs:hacluster-74", "hacluster"),
+        ("ch:amd64/focal/ceph-osd-513", "ceph-osd"),
+        ("local:focal/my-charm-0", "my-charm"),
     ],
 )
 def test_parse_charm_name(charm_url, exp_name):
@@ -229,6 +317,26 @@ def test_parse_charm_name(charm_url, exp_name):
     assert parse_charm_name(charm_url) == exp_name
 
 
+@pytest.mark.parametrize(
+    "charm_url",
+    ["nova-compute-141", "cs:focal/nova-compute", "cs:focal/nova-compute-", "cs:"],
+)
+def test_parse_charm_name_failure(charm_url):
+    """Test parsing invalid charm-url."""
+    with pytest.raises(CharmException):
+        parse_charm_name(charm_url)
+
+
+def test_parse_charm_name_cached():
+    """Test that parsed charm names are cached."""
+    parse_charm_name.cache_clear()
+
+    assert parse_charm_name("cs:focal/ceph-osd-310") == "ceph-osd"
+    assert parse_charm_name("cs:focal/ceph-osd-310") == "ceph-osd"
+    assert parse_charm_name.cache_info().hits == 1
+    assert parse_charm_name.cache_info().misses == 1
+
+
 @pytest.mark.parametrize(
     "charm_name, units",
     [
@@ -24,8 +24,12 @@ from juju.model import Model
 from juju.unit import Unit
 
 from juju_verify.exceptions import VerificationError
-from juju_verify.verifiers.base import BaseVerifier
-from juju_verify.verifiers.result import Partial, Severity
+from juju_verify.verifiers.base import (
+    BaseVerifier,
+    _get_leader_statuses,
+    _parent_machine_ids,
+)
+from juju_verify.verifiers.result import Partial, Result, Severity
 
 
 def test_base_verifier_verify_no_units():
@@ -102,6 +106,52 @@ def test_base_verifier_warn_on_unchecked_units(mocker):
     assert expected_partial_result not in result.partials
 
 
+def test_base_verifier_ignore_subordinate_units(mocker):
+    """Do not warn about unchecked subordinate units on affected machine."""
+    machine = MagicMock()
+    machine.entity_id = "0"
+
+    mocker.patch.object(
+        Unit, "machine", new_callable=PropertyMock(return_value=machine)
+    )
+    mocker.patch.object(
+        Unit, "data", new_callable=PropertyMock(return_value={"subordinate": True})
+    )
+    mocker.patch.object(Model, "units")
+
+    model = Model()
+    checked_unit = Unit("nova-compute/0", model)
+    subordinate_unit = Unit("ntp/0", model)
+    model.units = {"nova-compute/0": checked_unit, "ntp/0": subordinate_unit}
+
+    verifier = BaseVerifier([checked_unit])
+
+    assert not verifier.check_affected_machines().partials
+
+
+def test_base_verifier_machine_unit_index(mocker):
+    """Test that units in the model are indexed by machine only once."""
+    machine = MagicMock()
+    machine.entity_id = "0"
+    mock_machine = mocker.patch.object(
+        Unit, "machine", new_callable=PropertyMock, return_value=machine
+    )
+    mocker.patch.object(Model, "units")
+
+    model = Model()
+    unit_1 = Unit("nova-compute/0", model)
+    unit_2 = Unit("ceph-osd/0", model)
+    model.units = {"nova-compute/0": unit_1, "ceph-osd/0": unit_2}
+    verifier = BaseVerifier([unit_1])
+    mock_machine.reset_mock()
+
+    index = verifier._machine_unit_index
+    assert list(index) == ["0"]
+    assert index["0"][0] is unit_1 and index["0"][1] is unit_2
+    assert verifier._machine_unit_index is index
+    assert mock_machine.call_count == 2
+
+
 def test_base_verifier_unit_ids():
     """Test return value of property BaseVerifier.unit_ids."""
     unit_ids = ["nova-compute/0", "nova-compute/1"]
@@ -113,7 +163,7 @@ def test_base_verifier_unit_ids():
 
     verifier = BaseVerifier(units)
 
-    assert unit_ids == verifier.unit_ids
+    assert tuple(unit_ids) == verifier.unit_ids
 
 
 @pytest.mark.parametrize(
@@ -132,6 +182,39 @@ def test_base_verifier_supported_checks(mocker, check_name, check_method):
     mock_method.assert_called_once()
 
 
+@pytest.mark.parametrize("debug_enabled", [True, False])
+def test_base_verifier_verify_debug_log(mocker, debug_enabled):
+    """Test that units are listed in the log only if debug logging is enabled."""
+    unit = Unit("foo", Model())
+    mock_logger = mocker.patch("juju_verify.verifiers.base.logger")
+    mock_logger.isEnabledFor.return_value = debug_enabled
+    mocker.patch.object(BaseVerifier, "check_affected_machines")
+    mocker.patch.object(BaseVerifier, "check_has_sub_machines")
+    mocker.patch.object(BaseVerifier, "verify_reboot")
+
+    BaseVerifier([unit]).verify("reboot")
+
+    if debug_enabled:
+        mock_logger.debug.assert_called_once_with(
+            "Running check %s on units: %s", "reboot", "foo"
+        )
+    else:
+        mock_logger.debug.assert_not_called()
+
+
+def test_base_verifier_supported_checks_cached():
+    """Test that supported checks are computed only once per class."""
+
+    class DummyVerifier(BaseVerifier):  # pylint: disable=R0903,W0223
+        """Verifier with additional check."""
+
+        CHECKS = {**BaseVerifier.CHECKS, "dummy": "verify_reboot"}
+
+    assert BaseVerifier.supported_checks() is BaseVerifier.supported_checks()
+    assert BaseVerifier.supported_checks() == ("shutdown", "reboot")
+    assert DummyVerifier.supported_checks() == ("shutdown", "reboot", "dummy")
+
+
 def test_base_verifier_unsupported_check(mocker):
     """Raise exception if check is unknown/unsupported."""
     unit = Unit("foo", Model())
@@ -166,7 +249,7 @@ def test_base_verifier_unexpected_verify_error(mocker):
     mocker.patch.object(BaseVerifier, "check_has_sub_machines")
     verifier = BaseVerifier([unit])
     check = BaseVerifier.supported_checks()[0]
-    check_method = BaseVerifier._action_map().get(check).__name__
+    check_method = BaseVerifier.CHECKS[check]
     internal_msg = "Something failed."
     internal_err = RuntimeError(internal_msg)
     expected_msg = f"Verification failed: {internal_msg}"
@@ -208,6 +291,64 @@ def test_base_verifier_run_action_on_all_units(mock_run_action_on_units, model):
     mock_run_action_on_units.assert_called_with(units, "test", False, None)
 
 
+def test_base_verifier_check_has_sub_machines_no_children(mocker, model):
+    """Test that no leader status is queried if there are no child machines."""
+    mock_get_event_loop = mocker.patch.object(asyncio, "get_event_loop")
+    verifier = BaseVerifier([model.units["nova-compute/0"]])
+
+    result = verifier.check_has_sub_machines()
+
+    assert result == Result()
+    mock_get_event_loop.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "machine_id, exp_parents",
+    [
+        ("0", []),
+        ("0/lxd/1", ["0/lxd", "0"]),
+        ("10/lxd/1/kvm/0", ["10/lxd/1/kvm", "10/lxd/1", "10/lxd", "10"]),
+    ],
+)
+def test_parent_machine_ids(machine_id, exp_parents):
+    """Test listing IDs of all machines hosting the machine."""
+    assert list(_parent_machine_ids(machine_id)) == exp_parents
+
+
+def test_get_leader_statuses():
+    """Test querying leadership of multiple units."""
+    units = [MagicMock(), MagicMock()]
+    for unit, is_leader in zip(units, (True, False)):
+        unit.is_leader_from_status = mock.AsyncMock(return_value=is_leader)
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(_get_leader_statuses(units)) == [True, False]
+    finally:
+        loop.close()
+
+
+def test_base_verifier_child_units_by_parent(mocker):
+    """Test finding units on child machines of verified units."""
+    machine = MagicMock()
+    machine.entity_id = "0"
+    mocker.patch.object(
+        Unit, "machine", new_callable=PropertyMock, return_value=machine
+    )
+    parent_unit = Unit("nova-compute/0", Model())
+    child_1, child_2, other_unit = MagicMock(), MagicMock(), MagicMock()
+    verifier = BaseVerifier([parent_unit])
+    # cached property is replaced by prepared index of model units
+    verifier.__dict__["_machine_unit_index"] = {
+        "0": [parent_unit],
+        "0/lxd/1": [child_1],
+        "0/lxd/1/kvm/0": [child_2],
+        "1": [other_unit],
+    }
+
+    assert verifier._child_units_by_parent() == {"nova-compute/0": [child_1, child_2]}
+
+
 def test_base_verifier_check_has_sub_machines(mocker):
     """Test check unit has sub machines verifier."""
     main_unit = "nova-compute/0"
@@ -229,7 +370,11 @@ def test_base_verifier_check_has_sub_machines(mocker):
     ]
 
     # is_leader_from_status result for every child
-    mocker.patch.object(loop, "run_until_complete").return_value = [True]
+    def run_until_complete(coroutine):
+        coroutine.close()
+        return [True]
+
+    mocker.patch.object(loop, "run_until_complete").side_effect = run_until_complete
 
     unit_list = []
     for unit in units:
@@ -242,7 +387,9 @@ def test_base_verifier_check_has_sub_machines(mocker):
         )
         mocker.patch.object(unit["unit_object"].machine, "entity_id", unit["machine"])
 
-    mocker.patch.object(Model.units, "items").return_value = unit_list
+    mocker.patch.object(Model.units, "values").return_value = [
+        unit_object for _, unit_object in unit_list
+    ]
 
     expected_partial_result = Partial(
         Severity.WARN,
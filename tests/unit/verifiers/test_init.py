@@ -125,8 +125,11 @@ def test_get_verifier_mixed_charms(mocker, model):
 
     units = [nova, ceph]
 
-    for verifier, exp_units in zip(get_verifiers(units), units):
+    for verifier, exp_units, exp_excluded in zip(
+        get_verifiers(units), units, reversed(units)
+    ):
         assert verifier.units == [exp_units]
+        assert verifier.exclude_affected_units == [exp_excluded]
 
 
 def test_get_verifier_empty_list():